@@ -11,54 +11,112 @@ import sys
 from typing import Optional
 
 from .agents import CodeAgent, ToolCallingAgent, TriageAgent
-from .models import OpenAIModel, LiteLLMModel, HuggingFaceModel
+from .executor import LocalPythonExecutor
+from .models import OpenAIModel, LiteLLMModel, HuggingFaceModel, OllamaModel, BedrockModel
 from .tools import WebSearchTool, FinalAnswerTool, get_tool
 
 logger = logging.getLogger(__name__)
 
+# A list marker is a number and period standing alone, so years, decimals and versions don't count
+_NUMBERED_ITEM_RE = re.compile(r'(?:^|(?<=\s))(\d+)\.(?=\s)')
+_FIRST_ITEM_RE = re.compile(r'(?:^|(?<=\s))1\.(?=\s)')
+_SECOND_ITEM_RE = re.compile(r'(?:^|(?<=\s))2\.(?=\s)')
+_DOUBLE_NEWLINE_RE = re.compile(r'\n\s*\n')
+
+_BAR = "=" * 60
+
+# Model classes by --model-type name
+_MODEL_CLASSES = {
+    "openai": OpenAIModel,
+    "litellm": LiteLLMModel,
+    "huggingface": HuggingFaceModel,
+    "ollama": OllamaModel,
+    "bedrock": BedrockModel,
+}
+
+
+class _StreamPrinter:
+    """Write streamed chunks to stdout, flushing on newlines or every few hundred characters."""
+
+    def __init__(self, flush_chars: int = 256):
+        self.flush_chars = flush_chars
+        self.pending = 0
+
+    def __call__(self, step: dict):
+        content = step["content"]
+        sys.stdout.write(content)
+        self.pending += len(content)
+        if self.pending > self.flush_chars or '\n' in content:
+            self.flush()
+
+    def flush(self):
+        sys.stdout.flush()
+        self.pending = 0
+
+
+def _print_code_output(step: dict):
+    print(f"\nCode output: {step['content']}")
+
+
+def _print_tool_result(step: dict):
+    print(f"\nTool result: {step['result']}")
+
+
+def _print_error(step: dict):
+    print(f"\nError: {step['content']}")
+
+
+# Printers for intermediate steps yielded by a running agent, keyed by step type.
+# "stream" steps go to a _StreamPrinter created for each run.
+_STEP_PRINTERS = {
+    "code_output": _print_code_output,
+    "tool_result": _print_tool_result,
+    "error": _print_error,
+}
+
 
 def _format_final_answer(answer: str) -> str:
     """Format the final answer with proper line breaks and structure."""
     if not answer:
         return answer
-    
-    # Split by common patterns and add proper formatting
-    lines = []
-    
-    # Handle numbered lists (1., 2., etc.)
-    if '1.' in answer and '2.' in answer:
-        # Split by numbered items
-        parts = answer.split('1.')
-        if len(parts) > 1:
-            lines.append(parts[0].strip())  # Add any text before the first item
-            remaining = '1.' + parts[1]
-            
-            # Split by numbered items
-            items = re.split(r'(\d+\.)', remaining)
-            
-            for i in range(0, len(items), 2):
-                if i + 1 < len(items):
-                    number = items[i].strip()
-                    content = items[i + 1].strip()
-                    if number and content:
-                        lines.append(f"\n{number} {content}")
-        else:
-            lines.append(answer)
+
+    has_newline = '\n' in answer
+
+    # Without periods or newlines there are no items, sentences or blank lines to rework
+    if '.' not in answer and not has_newline:
+        return answer
+
+    # Handle numbered lists (1., 2., etc.); prose without a 1. then 2. marker stops here
+    first = _FIRST_ITEM_RE.search(answer)
+    second = _SECOND_ITEM_RE.search(answer, first.end()) if first else None
+    if second:
+        # Only markers counting up from 1. belong to the list; other numbers stay in the text
+        matches = [first, second]
+        for match in _NUMBERED_ITEM_RE.finditer(answer, second.end()):
+            if match.group(1) == str(len(matches) + 1):
+                matches.append(match)
+
+        # Each item runs from the end of its number to the start of the next one
+        ends = [match.start() for match in matches[1:]] + [len(answer)]
+        items = (
+            (match.group(), answer[match.end():end].strip())
+            for match, end in zip(matches, ends)
+        )
+
+        # Any text before the first item, then each item as its own paragraph
+        formatted = '\n\n'.join([
+            answer[:matches[0].start()].strip(),
+            *(f"{number} {content}" if content else number for number, content in items),
+        ])
     else:
         # Handle other formatting patterns
-        # Split by sentences and add line breaks
-        sentences = answer.split('. ')
-        for i, sentence in enumerate(sentences):
-            if i == len(sentences) - 1:
-                lines.append(sentence)
-            else:
-                lines.append(sentence + '.')
-    
-    # Join with proper spacing
-    formatted = '\n'.join(lines)
+        # Split by sentences and add line breaks, keeping each sentence's period
+        formatted = '.\n'.join(answer.split('. '))
     
-    # Clean up any double newlines
-    formatted = re.sub(r'\n\s*\n', '\n\n', formatted)
+    # Clean up any double newlines. The joins above only put newlines between
+    # non-blank text, so this pass is needed only if the answer had its own.
+    if has_newline:
+        formatted = _DOUBLE_NEWLINE_RE.sub('\n\n', formatted)
     
     return formatted
 
@@ -74,20 +132,10 @@ def setup_logging(verbose: bool = False):
 
 def create_model(model_type: str, model_id: str, **kwargs):
     """Create a model instance based on type."""
-    if model_type.lower() == "openai":
-        return OpenAIModel(model_id=model_id, **kwargs)
-    elif model_type.lower() == "litellm":
-        return LiteLLMModel(model_id=model_id, **kwargs)
-    elif model_type.lower() == "huggingface":
-        return HuggingFaceModel(model_id=model_id, **kwargs)
-    elif model_type.lower() == "ollama":
-        from .models import OllamaModel
-        return OllamaModel(model_id=model_id, **kwargs)
-    elif model_type.lower() == "bedrock":
-        from .models import BedrockModel
-        return BedrockModel(model_id=model_id, **kwargs)
-    else:
+    model_class = _MODEL_CLASSES.get(model_type.lower())
+    if model_class is None:
         raise ValueError(f"Unknown model type: {model_type}")
+    return model_class(model_id=model_id, **kwargs)
 
 
 def get_available_tools():
@@ -108,7 +156,7 @@ def create_tools(tool_names: list, log_file: Optional[str] = None):
                 pass
             tools.append(tool)
         else:
-            logger.warning(f"Tool '{tool_name}' not found")
+            logger.warning("Tool '%s' not found", tool_name)
     return tools
 
 
@@ -130,25 +178,25 @@ def run_agent(task: str,
     
     try:
         # Create model
-        logger.info(f"Creating {model_type} model: {model_id}")
+        logger.info("Creating %s model: %s", model_type, model_id)
         model = create_model(model_type, model_id, **kwargs)
         
         # Create tools
         if tools is None:
             tools = []  # No default tools
+        tool_set = frozenset(tools)
         
         tool_instances = create_tools(tools, log_file)
-        logger.info(f"Using tools: {[t.name for t in tool_instances]}")
+        logger.info("Using tools: %s", [t.name for t in tool_instances])
         
         # Create agent with execution mode
         # Auto-select agent type based on tools
-        if tools and len(tools) > 0:  # If any tools are specified
+        if tool_set:  # If any tools are specified
             agent_type = "tool"  # Use ToolCallingAgent for tool usage
-            logger.info(f"Auto-selected agent type: {agent_type} (tools detected)")
+            logger.info("Auto-selected agent type: %s (tools detected)", agent_type)
         
         if agent_type.lower() == "code":
             # Create executor with proper execution mode
-            from iagent.executor import LocalPythonExecutor
             executor = LocalPythonExecutor(dry_run=not execute)  # ← Set dry_run based on execute flag
             
             agent = CodeAgent(
@@ -185,11 +233,11 @@ def run_agent(task: str,
         # Run agent
         # Modify task if parse_logs tool is used with log file
         modified_task = task
-        if log_file and "parse_logs" in tools:
+        if log_file and "parse_logs" in tool_set:
             modified_task = f"Use the parse_logs tool to analyze the log file: {log_file}. {task}"
-            logger.info(f"Using log file: {log_file}")
+            logger.info("Using log file: %s", log_file)
         
-        logger.info(f"Running {agent_type} agent on task: {modified_task}")
+        logger.info("Running %s agent on task: %s", agent_type, modified_task)
         
         print("iagent is thinking...\n")
         
@@ -197,38 +245,37 @@ def run_agent(task: str,
         agent_response = agent.run(modified_task)
         
         # Remove debug output for cleaner display
-        import logging
         logging.getLogger('__main__').setLevel(logging.WARNING)
         
-        # Check if it's a generator or a result
-        if hasattr(agent_response, '__iter__') and not hasattr(agent_response, 'answer'):
+        # Check if it's a generator or a result (results always carry an answer)
+        if getattr(agent_response, 'answer', None) is None:
             # It's a generator; consume it and capture StopIteration.value for non-stream runs
             gen = agent_response
             final_result = None
+            stream_printer = _StreamPrinter()
+            step_printers = {**_STEP_PRINTERS, "stream": stream_printer}
             try:
                 while True:
                     step = next(gen)
-                    if isinstance(step, dict) and "type" in step:
-                        if step["type"] == "stream":
-                            print(step["content"], end="", flush=True)
-                        elif step["type"] == "code_output":
-                            print(f"\nCode output: {step['content']}")
-                        elif step["type"] == "tool_result":
-                            print(f"\nTool result: {step['result']}")
-                        elif step["type"] == "error":
-                            print(f"\nError: {step['content']}")
-                        elif step["type"] == "final":
+                    if isinstance(step, dict):
+                        step_type = step.get("type")
+                        printer = step_printers.get(step_type)
+                        if printer:
+                            printer(step)
+                        elif step_type == "final":
                             final_result = step["result"]
             except StopIteration as e:
                 if getattr(e, "value", None) is not None and final_result is None:
                     final_result = e.value
+            finally:
+                stream_printer.flush()
             if final_result is not None:
                 print(f"\n\nFinal Answer:")
-                print("=" * 60)
+                print(_BAR)
                 # Format the answer with proper line breaks
                 formatted_answer = _format_final_answer(final_result.answer)
                 print(formatted_answer)
-                print("=" * 60)
+                print(_BAR)
                 print(f"Duration: {final_result.duration:.2f}s")
                 print(f"Steps: {len(final_result.steps)}")
             else:
@@ -237,16 +284,16 @@ def run_agent(task: str,
             # It's a result object
             result = agent_response
             print(f"\n\nFinal Answer:")
-            print("=" * 60)
+            print(_BAR)
             # Format the answer with proper line breaks
             formatted_answer = _format_final_answer(result.answer)
             print(formatted_answer)
-            print("=" * 60)
+            print(_BAR)
             print(f"Duration: {result.duration:.2f}s")
             print(f"Steps: {len(result.steps)}")
     
     except Exception as e:
-        logger.error(f"Agent execution failed: {e}")
+        logger.error("Agent execution failed: %s", e)
         print(f"Error: {e}")
         sys.exit(1)
 
@@ -301,7 +348,7 @@ Safety Note:
     parser.add_argument(
         "--model-type",
         default="openai",
-        choices=["openai", "litellm", "huggingface", "ollama", "bedrock"],
+        choices=list(_MODEL_CLASSES),
         help="Model provider (default: openai)"
     )
     
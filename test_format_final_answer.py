@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Regression cases for the CLI's final answer formatting (numbered lists vs. plain prose)
+"""
+
+import sys
+sys.path.insert(0, 'src')
+
+from iagent.cli import _format_final_answer
+
+# (answer, expected formatted answer)
+_CASES = [
+    # Numbered lists
+    ("Intro 1. first 2. second 3. third",
+     "Intro\n\n1. first\n\n2. second\n\n3. third"),
+    ("Steps:\n1. do\n2. this\n3. that",
+     "Steps:\n\n1. do\n\n2. this\n\n3. that"),
+    # Empty items keep their number
+    ("1. First\n2.\n3. Third",
+     "\n\n1. First\n\n2.\n\n3. Third"),
+    # Years are not list markers
+    ("Sales grew in 2022. They fell in 2023.",
+     "Sales grew in 2022.\nThey fell in 2023."),
+    ("In 2022. we did 1. a 2. b in 2023. ok",
+     "In 2022. we did\n\n1. a\n\n2. b in 2023. ok"),
+    # Decimals and versions are not list markers
+    ("Python 3.12 was released in 2023. It adds faster startup.",
+     "Python 3.12 was released in 2023.\nIt adds faster startup."),
+    ("Upgrade from 2.7 to 3.11 now.",
+     "Upgrade from 2.7 to 3.11 now."),
+    ("2.3.",
+     "2.3."),
+    # Prose with years and decimals never reaches the list path
+    ("Revenue in Q1 rose. In Q2. it fell.",
+     "Revenue in Q1 rose.\nIn Q2.\nit fell."),
+    ("Use a 3.5 mm cable. Bought in 2023. Works.",
+     "Use a 3.5 mm cable.\nBought in 2023.\nWorks."),
+]
+
+
+def main():
+    failures = 0
+    for answer, expected in _CASES:
+        formatted = _format_final_answer(answer)
+        if formatted != expected:
+            failures += 1
+            print(f"FAIL: {answer!r}")
+            print(f"  expected: {expected!r}")
+            print(f"  got:      {formatted!r}")
+
+    print(f"{len(_CASES) - failures}/{len(_CASES)} formatting cases passed")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,18 @@ Detailed test for parse_logs tool - shows full LLM recommendations and analysis
 
 import sys
 import os
-import json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 sys.path.insert(0, 'src')
 
 from iagent.tools import get_tool
 
+_BAR = "=" * 60
+_SUBBAR = "-" * 40
+_ITEM_BAR = "-" * 30
+
 def main():
     # Check API key
     if not os.getenv("OPENAI_API_KEY"):
@@ -20,16 +27,16 @@ def main():
     parse_logs = get_tool('parse_logs')
     
     print("Testing parse_logs with FULL OUTPUT...")
-    print("=" * 60)
+    print(_BAR)
     
     # Test NGINX logs
     print("\nANALYZING NGINX LOGS...")
-    print("-" * 40)
+    print(_SUBBAR)
     
     result = parse_logs.execute("nginx_access.log", window_minutes=600, log_type="nginx")
     
     # Parse and display FULL analysis
-    data = json.loads(result)
+    data = json_loads(result)
     
     print(f"SUMMARY:")
     print(f"  • Total entries: {data['summary']['total_entries']}")
@@ -60,16 +67,16 @@ def main():
     print(f"  • Average requests/min: {data['performance_analysis']['average_requests_per_minute']}")
     
     print(f"\nLLM-GENERATED RECOMMENDATIONS:")
-    print("=" * 60)
+    print(_BAR)
     
     for i, rec in enumerate(data['devops_recommendations'], 1):
         print(f"\nRECOMMENDATION {i}:")
-        print("-" * 30)
+        print(_ITEM_BAR)
         print(rec)
         print()
     
     print("Full analysis completed!")
-    print("=" * 60)
+    print(_BAR)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,6 +5,10 @@ Ultra-minimal test for parse_logs tool
 
 import sys
 import os
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 sys.path.insert(0, 'src')
 
 from iagent.tools import get_tool
@@ -24,8 +28,7 @@ def main():
     result = parse_logs.execute("nginx_access.log", window_minutes=600, log_type="nginx")
     
     # Show key info
-    import json
-    data = json.loads(result)
+    data = json_loads(result)
     
     print(f"Entries: {data['summary']['total_entries']}")
     print(f"Security: {data['security_analysis']['threat_level']}")
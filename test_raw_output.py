@@ -5,11 +5,17 @@ Show RAW JSON output from parse_logs tool
 
 import sys
 import os
-import json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 sys.path.insert(0, 'src')
 
 from iagent.tools import get_tool
 
+_BAR = "=" * 50
+_SUBBAR = "-" * 30
+
 def main():
     if not os.getenv("OPENAI_API_KEY"):
         print("Set OPENAI_API_KEY first: export OPENAI_API_KEY='your-key'")
@@ -18,21 +24,21 @@ def main():
     parse_logs = get_tool('parse_logs')
     
     print("RAW OUTPUT FROM parse_logs TOOL:")
-    print("=" * 50)
+    print(_BAR)
     
     # Test NGINX logs
     result = parse_logs.execute("nginx_access.log", window_minutes=600, log_type="nginx")
     
     print("RAW JSON OUTPUT:")
-    print("-" * 30)
+    print(_SUBBAR)
     print(result)
     
-    print("\n" + "=" * 50)
+    print("\n" + _BAR)
     print("PARSED RECOMMENDATIONS:")
-    print("-" * 30)
+    print(_SUBBAR)
     
     # Parse and show just the recommendations
-    data = json.loads(result)
+    data = json_loads(result)
     for i, rec in enumerate(data['devops_recommendations'], 1):
         print(f"\n--- RECOMMENDATION {i} ---")
         print(rec)
@@ -5,11 +5,46 @@ Detailed security log test - shows full security analysis and LLM recommendation
 
 import sys
 import os
-import json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 sys.path.insert(0, 'src')
 
 from iagent.tools import get_tool
 
+_BAR = "=" * 60
+_SUBBAR = "-" * 40
+
+# Security log with various threats (brute-force SSH logins and web path probing)
+_SECURITY_LOG_BYTES = (
+    b"Sep 16 09:30:15 server1 sshd[1234]: Failed password for root from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:30:20 server1 sshd[1235]: Failed password for admin from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:30:25 server1 sshd[1236]: Failed password for user from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:30:30 server1 sshd[1237]: Connection closed by 192.168.1.100 port 22 [preauth]\n"
+    b"Sep 16 09:30:35 server1 sshd[1238]: Failed password for root from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:30:40 server1 sshd[1239]: Failed password for admin from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:30:45 server1 sshd[1240]: Failed password for user from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:30:50 server1 sshd[1241]: Connection closed by 192.168.1.100 port 22 [preauth]\n"
+    b"Sep 16 09:30:55 server1 sshd[1242]: Failed password for root from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:00 server1 sshd[1243]: Failed password for admin from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:05 server1 sshd[1244]: Failed password for user from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:10 server1 sshd[1245]: Connection closed by 192.168.1.100 port 22 [preauth]\n"
+    b"Sep 16 09:31:15 server1 sshd[1246]: Failed password for root from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:20 server1 sshd[1247]: Failed password for admin from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:25 server1 sshd[1248]: Failed password for user from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:30 server1 sshd[1249]: Connection closed by 192.168.1.100 port 22 [preauth]\n"
+    b"Sep 16 09:31:35 server1 sshd[1250]: Failed password for root from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:40 server1 sshd[1251]: Failed password for admin from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:45 server1 sshd[1252]: Failed password for user from 192.168.1.100 port 22 ssh2\n"
+    b"Sep 16 09:31:50 server1 sshd[1253]: Connection closed by 192.168.1.100 port 22 [preauth]\n"
+    b"Sep 16 09:32:00 server1 apache2[2000]: [error] [client 198.51.100.10] File does not exist: /var/www/html/admin.php\n"
+    b"Sep 16 09:32:05 server1 apache2[2001]: [error] [client 198.51.100.10] File does not exist: /var/www/html/config.php\n"
+    b"Sep 16 09:32:10 server1 apache2[2002]: [error] [client 198.51.100.10] File does not exist: /var/www/html/backup.sql\n"
+    b"Sep 16 09:32:15 server1 apache2[2003]: [error] [client 198.51.100.10] File does not exist: /var/www/html/wp-admin.php\n"
+    b"Sep 16 09:32:20 server1 apache2[2004]: [error] [client 198.51.100.10] File does not exist: /var/www/html/login.php\n"
+)
+
 def main():
     # Check API key
     if not os.getenv("OPENAI_API_KEY"):
@@ -20,48 +55,20 @@ def main():
     parse_logs = get_tool('parse_logs')
     
     print("Testing SECURITY LOG ANALYSIS with FULL OUTPUT...")
-    print("=" * 60)
-    
-    # Create a security log with various threats
-    security_log_content = """Sep 16 09:30:15 server1 sshd[1234]: Failed password for root from 192.168.1.100 port 22 ssh2
-Sep 16 09:30:20 server1 sshd[1235]: Failed password for admin from 192.168.1.100 port 22 ssh2
-Sep 16 09:30:25 server1 sshd[1236]: Failed password for user from 192.168.1.100 port 22 ssh2
-Sep 16 09:30:30 server1 sshd[1237]: Connection closed by 192.168.1.100 port 22 [preauth]
-Sep 16 09:30:35 server1 sshd[1238]: Failed password for root from 192.168.1.100 port 22 ssh2
-Sep 16 09:30:40 server1 sshd[1239]: Failed password for admin from 192.168.1.100 port 22 ssh2
-Sep 16 09:30:45 server1 sshd[1240]: Failed password for user from 192.168.1.100 port 22 ssh2
-Sep 16 09:30:50 server1 sshd[1241]: Connection closed by 192.168.1.100 port 22 [preauth]
-Sep 16 09:30:55 server1 sshd[1242]: Failed password for root from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:00 server1 sshd[1243]: Failed password for admin from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:05 server1 sshd[1244]: Failed password for user from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:10 server1 sshd[1245]: Connection closed by 192.168.1.100 port 22 [preauth]
-Sep 16 09:31:15 server1 sshd[1246]: Failed password for root from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:20 server1 sshd[1247]: Failed password for admin from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:25 server1 sshd[1248]: Failed password for user from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:30 server1 sshd[1249]: Connection closed by 192.168.1.100 port 22 [preauth]
-Sep 16 09:31:35 server1 sshd[1250]: Failed password for root from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:40 server1 sshd[1251]: Failed password for admin from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:45 server1 sshd[1252]: Failed password for user from 192.168.1.100 port 22 ssh2
-Sep 16 09:31:50 server1 sshd[1253]: Connection closed by 192.168.1.100 port 22 [preauth]
-Sep 16 09:32:00 server1 apache2[2000]: [error] [client 198.51.100.10] File does not exist: /var/www/html/admin.php
-Sep 16 09:32:05 server1 apache2[2001]: [error] [client 198.51.100.10] File does not exist: /var/www/html/config.php
-Sep 16 09:32:10 server1 apache2[2002]: [error] [client 198.51.100.10] File does not exist: /var/www/html/backup.sql
-Sep 16 09:32:15 server1 apache2[2003]: [error] [client 198.51.100.10] File does not exist: /var/www/html/wp-admin.php
-Sep 16 09:32:20 server1 apache2[2004]: [error] [client 198.51.100.10] File does not exist: /var/www/html/login.php
-"""
+    print(_BAR)
     
     # Write test security log
-    with open("test_security_detailed.log", "w") as f:
-        f.write(security_log_content)
+    with open("test_security_detailed.log", "wb") as f:
+        f.write(_SECURITY_LOG_BYTES)
     
     try:
         print("\nANALYZING SECURITY LOGS...")
-        print("-" * 40)
+        print(_SUBBAR)
         
         result = parse_logs.execute("test_security_detailed.log", window_minutes=1440, log_type="syslog")
         
         # Parse and display FULL analysis
-        data = json.loads(result)
+        data = json_loads(result)
         
         print(f"SUMMARY:")
         print(f"  • Total entries: {data['summary']['total_entries']}")
@@ -83,16 +90,16 @@ Sep 16 09:32:20 server1 apache2[2004]: [error] [client 198.51.100.10] File does
         print(f"  • Average requests/min: {data['performance_analysis']['average_requests_per_minute']}")
         
         print(f"\nLLM-GENERATED SECURITY RECOMMENDATIONS:")
-        print("=" * 60)
+        print(_BAR)
         
         for i, rec in enumerate(data['devops_recommendations'], 1):
             print(f"\nSECURITY RECOMMENDATION {i}:")
-            print("-" * 40)
+            print(_SUBBAR)
             print(rec)
             print()
         
         print("Security analysis completed!")
-        print("=" * 60)
+        print(_BAR)
         
     except Exception as e:
         print(f"Security test failed: {e}")